@@ -8,7 +8,12 @@ import os
 from datetime import datetime
 import json
 import time  # Added for sleep function
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
+from extractive import compress_text
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +31,87 @@ if not PERPLEXITY_URL_API_KEY:
 if not PERPLEXITY_TEXT_API_KEY:
     print("Warning: PERPLEXITY_TEXT_API_KEY environment variable not set")
 
+# How article text is fitted into each prompt's character budget:
+# "extractive" packs the most salient sentences, "truncate" keeps the leading characters
+COMPRESSION_MODE = os.getenv('COMPRESSION_MODE', 'extractive').strip().lower()
+SUMMARY_TEXT_BUDGET = 2000
+BIAS_TEXT_BUDGET = 1500
+
+if COMPRESSION_MODE not in ('extractive', 'truncate'):
+    print(f"Warning: unknown COMPRESSION_MODE '{COMPRESSION_MODE}', falling back to truncate")
+    COMPRESSION_MODE = 'truncate'
+
+def fit_to_budget(text, budget):
+    """Fit article text into a prompt's character budget using COMPRESSION_MODE"""
+    if COMPRESSION_MODE == 'truncate':
+        return text[:budget]
+    
+    start = time.perf_counter()
+    compressed = compress_text(text, budget)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    print(f"✂️ Extractive compression: {len(text)} -> {len(compressed)} characters in {elapsed_ms:.1f}ms")
+    return compressed
+
+# Built-in summary tones, used for multi-tone comparison
+SUMMARY_TONES = ['neutral', 'positive', 'negative', 'analytical']
+
+# In-memory cache of Perplexity results keyed by (kind, article hash, source type[, tone]),
+# plus the generations currently in flight so concurrent requests share one API call
+ANALYSIS_CACHE_MAX_ENTRIES = 256
+_analysis_cache = OrderedDict()
+_analysis_in_flight = {}
+_analysis_cache_lock = threading.Lock()
+
+def _analysis_cache_key(kind, text, is_url, *extra):
+    """Build the cache key for a result computed from the given article text"""
+    text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+    return (kind, text_hash, is_url) + extra
+
+def get_or_compute(key, compute):
+    """Return the cached result for key, or run compute() once and share its result
+
+    compute() returns (result, cacheable). Concurrent callers with the same key
+    wait for the first caller instead of repeating the API call. Results that are
+    not cacheable (fallbacks after errors) reach those waiters but are not stored.
+    """
+    with _analysis_cache_lock:
+        if key in _analysis_cache:
+            _analysis_cache.move_to_end(key)
+            print(f"📦 Using cached {key[0]} result")
+            return _analysis_cache[key]
+        
+        future = _analysis_in_flight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _analysis_in_flight[key] = future
+    
+    if not is_owner:
+        print(f"⏳ Waiting for in-flight {key[0]} request")
+        return future.result()
+    
+    try:
+        result, cacheable = compute()
+    except BaseException as e:
+        # Always release waiters, even on KeyboardInterrupt/SystemExit, but only
+        # hand them ordinary exceptions
+        with _analysis_cache_lock:
+            del _analysis_in_flight[key]
+        if not isinstance(e, Exception):
+            e = Exception(f"{key[0]} request was interrupted")
+        future.set_exception(e)
+        raise
+    
+    with _analysis_cache_lock:
+        if cacheable:
+            _analysis_cache[key] = result
+            _analysis_cache.move_to_end(key)
+            while len(_analysis_cache) > ANALYSIS_CACHE_MAX_ENTRIES:
+                _analysis_cache.popitem(last=False)
+        del _analysis_in_flight[key]
+    future.set_result(result)
+    return result
+
 def extract_text_from_url(url):
     """ROBUST URL extraction with detailed error handling and multiple strategies"""
     try:
@@ -223,6 +309,11 @@ def extract_text_from_url(url):
             raise Exception(f"Failed to extract article: {error_msg}")
 
 def generate_summary(text, tone, is_url=False):
+    """Generate summary, reusing a cached or in-flight one for the same article and tone"""
+    key = _analysis_cache_key('summary', text, is_url, tone)
+    return get_or_compute(key, lambda: (_request_summary(text, tone, is_url), True))
+
+def _request_summary(text, tone, is_url):
     """Generate summary using appropriate Perplexity API based on source type"""
     tone_prompts = {
         "neutral": f"Just give answers according to the tone: {tone} and the answer should be according to the Question only and the form of the answer will be properly structured and concise.Provide a neutral, factual summary of this article. The summary should be well-structured, concise, and focus on the key points without bias.",
@@ -232,7 +323,7 @@ def generate_summary(text, tone, is_url=False):
     }
     
     selected_prompt = tone_prompts.get(tone, tone_prompts['neutral'])
-    prompt = f"{selected_prompt}\n\nArticle text:\n{text[:2000]}"  # Reduced text limit
+    prompt = f"{selected_prompt}\n\nArticle text:\n{fit_to_budget(text, SUMMARY_TEXT_BUDGET)}"
     
     try:
         # Choose API key based on source type
@@ -286,6 +377,8 @@ def generate_summary(text, tone, is_url=False):
                         raise Exception("Invalid response format from Perplexity API")
                     
                     summary = response_data["choices"][0]["message"]["content"].strip()
+                    usage = response_data.get('usage', {})
+                    print(f"Token usage ({COMPRESSION_MODE}): {usage.get('prompt_tokens', '?')} prompt, {usage.get('completion_tokens', '?')} completion")
                     print(f"📝 Generated summary successfully ({len(summary)} characters)")
                     return summary
                     
@@ -332,8 +425,46 @@ def generate_summary(text, tone, is_url=False):
         print(f"Summary generation error: {str(e)}")
         raise Exception(f"Failed to generate summary: {str(e)}")
 
+def generate_tone_summaries(text, tones, is_url=False):
+    """Generate summaries for several tones concurrently from the same article text
+
+    Returns (summaries, errors), two dicts keyed by tone in request order.
+    """
+    print(f"🎭 Generating {len(tones)} tone summaries concurrently...")
+    
+    def summarize(tone):
+        try:
+            return generate_summary(text, tone, is_url=is_url), None
+        except Exception as e:
+            return None, str(e)
+    
+    with ThreadPoolExecutor(max_workers=len(tones)) as executor:
+        outcomes = list(executor.map(summarize, tones))
+    
+    summaries = {}
+    errors = {}
+    for tone, (summary, error) in zip(tones, outcomes):
+        if summary is not None:
+            summaries[tone] = summary
+        else:
+            print(f"❌ {tone} summary failed: {error}")
+            errors[tone] = error
+    
+    if not summaries:
+        raise Exception(next(iter(errors.values())))
+    
+    return summaries, errors
+
 def analyze_bias(text, is_url=False):
-    """Analyze bias and fake news using appropriate Perplexity API based on source type"""
+    """Analyze bias, reusing a cached or in-flight analysis of the same article"""
+    key = _analysis_cache_key('bias', text, is_url)
+    return get_or_compute(key, lambda: _request_bias_analysis(text, is_url))
+
+def _request_bias_analysis(text, is_url):
+    """Analyze bias and fake news using appropriate Perplexity API based on source type
+
+    Returns (analysis, cacheable); fallback analyses after errors are not cacheable.
+    """
     print(f"Analyzing bias and fake news with {'URL' if is_url else 'Text'} API key...")
     
     try:
@@ -373,8 +504,8 @@ Please provide a comprehensive analysis and respond ONLY in valid JSON format:
 
 Look for red flags like: absurd health claims, fake organizations, sensationalized headlines, lack of credible sources, emotional manipulation, conspiracy theories.
 
-Article Text (first 1500 characters):
-{text[:1500]}"""
+Article Text (up to {BIAS_TEXT_BUDGET} characters):
+{fit_to_budget(text, BIAS_TEXT_BUDGET)}"""
 
         # Choose API key based on source type
         api_key = PERPLEXITY_URL_API_KEY if is_url else PERPLEXITY_TEXT_API_KEY
@@ -420,7 +551,10 @@ Article Text (first 1500 characters):
                 print(f"API Response Status: {response.status_code}")
                 
                 if response.status_code == 200:
-                    perplexity_response = response.json()["choices"][0]["message"]["content"].strip()
+                    response_data = response.json()
+                    perplexity_response = response_data["choices"][0]["message"]["content"].strip()
+                    usage = response_data.get('usage', {})
+                    print(f"Bias token usage ({COMPRESSION_MODE}): {usage.get('prompt_tokens', '?')} prompt, {usage.get('completion_tokens', '?')} completion")
                     print(f"Perplexity API response received ({len(perplexity_response)} chars)")
                     break  # Success, exit retry loop
                     
@@ -455,7 +589,7 @@ Article Text (first 1500 characters):
                         'bias_indicators': ["API timeout occurred"],
                         'balance_score': 0.5,
                         'factual_score': 0.5
-                    }
+                    }, False
                 print("Retrying bias analysis with longer timeout...")
                 continue
                 
@@ -472,7 +606,7 @@ Article Text (first 1500 characters):
                         'bias_indicators': ["Connection error occurred"],
                         'balance_score': 0.5,
                         'factual_score': 0.5
-                    }
+                    }, False
                 print("Retrying bias analysis...")
                 continue
         
@@ -532,7 +666,7 @@ Article Text (first 1500 characters):
                 'bias_indicators': ["Fake news patterns detected"] if fake_patterns_found else [],
                 'balance_score': balance_score,
                 'factual_score': factual_score
-            }
+            }, True
             
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Failed to parse Perplexity response as JSON: {str(e)}")
@@ -568,7 +702,7 @@ Article Text (first 1500 characters):
                 'bias_indicators': ["Response parsing failed"] + (["Obvious fake news patterns"] if fake_patterns_found else []),
                 'balance_score': balance_score,
                 'factual_score': factual_score
-            }
+            }, False
             
     except Exception as e:
         print(f"Perplexity API error: {str(e)}")
@@ -587,10 +721,15 @@ Article Text (first 1500 characters):
             'bias_indicators': ["Obvious fake news patterns", "API error occurred"] if obvious_fake else ["API error occurred"],
             'balance_score': 0.1 if obvious_fake else 0.5,
             'factual_score': 0.0 if obvious_fake else 0.5
-        }
+        }, False
 
-def analyze_article(url=None, text=None, tone='neutral'):
-    """Main function to analyze an article"""
+def analyze_article(url=None, text=None, tone='neutral', tones=None):
+    """Main function to analyze an article
+
+    When ``tones`` is given, one summary per tone is generated from a single
+    extraction and bias analysis; ``summary`` holds the first that succeeded
+    and ``tone_errors`` maps each failed tone to its error message.
+    """
     try:
         is_url_source = bool(url and not text)
         
@@ -607,8 +746,13 @@ def analyze_article(url=None, text=None, tone='neutral'):
         if len(article_text.strip()) < 100:
             raise ValueError("Article text is too short to analyze effectively")
         
-        # Generate summary using appropriate API key
-        summary = generate_summary(article_text, tone, is_url=is_url_source)
+        # Generate summary (or one per requested tone) using appropriate API key
+        if tones:
+            tone_summaries, tone_errors = generate_tone_summaries(article_text, tones, is_url=is_url_source)
+            summary = next(iter(tone_summaries.values()))
+        else:
+            tone_summaries, tone_errors = None, None
+            summary = generate_summary(article_text, tone, is_url=is_url_source)
         
         # Analyze bias using appropriate API key
         bias_analysis = analyze_bias(article_text, is_url=is_url_source)
@@ -616,6 +760,8 @@ def analyze_article(url=None, text=None, tone='neutral'):
         return {
             'success': True,
             'summary': summary,
+            'tone_summaries': tone_summaries,
+            'tone_errors': tone_errors,
             'bias_score': bias_analysis['bias_score'],
             'sentiment': bias_analysis['sentiment'],
             'sources': bias_analysis['sources'],
@@ -661,6 +807,11 @@ def index():
             url = request.form.get('newsUrl', '').strip()
             text = request.form.get('newsText', '').strip()
             tone = request.form.get('customTone', 'neutral').strip() or 'neutral'
+            tones = [t for t in SUMMARY_TONES if t in request.form.getlist('compareTones')]
+            
+            # Custom instructions are compared alongside the ticked tones, not dropped
+            if tones and request.form.get('customTone', '').strip() and tone not in tones:
+                tones.insert(0, tone)
             
             # Validation
             if not url and not text:
@@ -671,7 +822,7 @@ def index():
                 error_message = 'Text analysis requires PERPLEXITY_TEXT_API_KEY to be configured'
             else:
                 # Analyze the article
-                analysis_result = analyze_article(url=url or None, text=text or None, tone=tone)
+                analysis_result = analyze_article(url=url or None, text=text or None, tone=tone, tones=tones or None)
                 
                 if analysis_result['success']:
                     result = analysis_result
@@ -683,6 +834,7 @@ def index():
     return render_template('index.html', 
                          result=result, 
                          error_message=error_message,
+                         summary_tones=SUMMARY_TONES,
                          perplexity_url_configured=PERPLEXITY_URL_API_KEY is not None,
                          perplexity_text_configured=PERPLEXITY_TEXT_API_KEY is not None)
 
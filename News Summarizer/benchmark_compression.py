@@ -0,0 +1,84 @@
+"""Compare extractive pre-compression against plain truncation.
+
+Usage:
+    python benchmark_compression.py [article.txt] [--runs N]
+
+Without an article file, a synthetic ~15,000 character article is used.
+Both modes fill almost the same character budget, so this script compares
+latency and content coverage only. Token usage can only be compared from the
+usage.prompt_tokens values the app logs for each Perplexity call.
+"""
+import argparse
+import random
+import statistics
+import time
+
+from extractive import compress_text, split_sentences
+
+BUDGETS = {'summary': 2000, 'bias': 1500}
+
+def build_synthetic_article(target_length=15000, seed=7):
+    """Build a deterministic news-like article of roughly target_length characters"""
+    rng = random.Random(seed)
+    subjects = ['The city council', 'Local officials', 'The transport ministry', 'Residents',
+                'Independent analysts', 'The regional governor', 'Opposition leaders', 'Engineers']
+    verbs = ['approved', 'criticized', 'questioned', 'funded', 'delayed', 'reviewed', 'defended', 'expanded']
+    objects = ['the new light-rail project', 'the housing budget', 'flood defence upgrades',
+               'the transit fare increase', 'the bridge repair contract', 'school renovation plans']
+    details = ['citing rising costs of {n} million dollars', 'after a {n}-page audit was published',
+               'following protests by {n} residents', 'with a vote of {n} to 4',
+               'despite warnings about {n} percent overruns']
+    byline = 'By Staff Reporter. Published Monday. Updated 2 hours ago. Share this article. '
+    sentences = []
+    length = len(byline)
+    while length < target_length:
+        sentence = (f"{rng.choice(subjects)} {rng.choice(verbs)} {rng.choice(objects)} "
+                    f"{rng.choice(details).format(n=rng.randint(5, 900))}.")
+        sentences.append(sentence)
+        length += len(sentence) + 1
+    return byline + ' '.join(sentences)
+
+def time_call(func, runs):
+    """Return the median wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('article', nargs='?', help='Path to a plain-text article')
+    parser.add_argument('--runs', type=int, default=50, help='Timed runs per mode (default: 50)')
+    args = parser.parse_args()
+
+    if args.article:
+        with open(args.article, encoding='utf-8') as f:
+            text = f.read()[:15000]
+    else:
+        text = build_synthetic_article()
+
+    print(f"Article: {len(text)} characters, {len(split_sentences(text))} sentences, {args.runs} runs per mode\n")
+    print(f"{'prompt':<8} {'mode':<11} {'chars':>6} {'median ms':>10} {'beyond cut':>11}")
+
+    compress_text(text, BUDGETS['summary'])  # Warm up NumPy before timing
+
+    for name, budget in BUDGETS.items():
+        modes = {
+            'truncate': lambda: text[:budget],
+            'extractive': lambda: compress_text(text, budget),
+        }
+        # Normalize the truncated reference the same way as the sentences compared to it
+        truncated = ' '.join(split_sentences(text[:budget]))
+        for mode, func in modes.items():
+            output = func()
+            elapsed_ms = time_call(func, args.runs)
+            # Share of sentences sent to the model that truncation would have dropped
+            sentences = split_sentences(output)
+            beyond = sum(1 for s in sentences if s not in truncated)
+            print(f"{name:<8} {mode:<11} {len(output):>6} "
+                  f"{elapsed_ms:>10.2f} {beyond / max(len(sentences), 1):>10.0%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+import re
+import numpy as np
+
+# Sentence boundary: whitespace after terminal punctuation (optionally followed by a
+# closing quote or parenthesis, which stays with its sentence), before something that
+# looks like the start of a new sentence
+SENTENCE_SPLIT_PATTERN = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\'”’)]))\s+(?=["\'“‘(]?[A-Z0-9])')
+
+# Fragments ending in these words are joined with the next one rather than split
+ABBREVIATIONS = frozenset([
+    'mr.', 'mrs.', 'ms.', 'dr.', 'prof.', 'sen.', 'rep.', 'gov.', 'gen.', 'col.', 'lt.', 'sgt.',
+    'st.', 'jr.', 'sr.', 'inc.', 'corp.', 'co.', 'ltd.', 'no.', 'vs.', 'u.s.', 'u.k.', 'e.g.', 'i.e.'
+])
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before
+being below between both but by can could did do does doing down during each few for from
+further had has have having he her here hers herself him himself his how i if in into is it
+its itself just me more most my myself no nor not now of off on once only or other our ours
+ourselves out over own said same says she should so some such than that the their theirs them
+themselves then there these they this those through to too under until up very was we were
+what when where which while who whom why will with would you your yours yourself yourselves
+""".split())
+
+# Only this much text, and at most this many sentences, is ranked; this bounds the
+# sentences x vocabulary and sentences x sentences matrices for pasted text
+MAX_INPUT_CHARS = 15000
+MAX_SENTENCES = 400
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITERATIONS = 50
+TEXTRANK_TOLERANCE = 1e-6
+
+def split_sentences(text):
+    """Split article text into sentences, dropping empty fragments"""
+    text = re.sub(r'\s+', ' ', text).strip()
+    sentences = []
+    for fragment in SENTENCE_SPLIT_PATTERN.split(text):
+        fragment = fragment.strip()
+        if not fragment:
+            continue
+        if sentences and sentences[-1].rsplit(' ', 1)[-1].lower() in ABBREVIATIONS:
+            sentences[-1] = f"{sentences[-1]} {fragment}"
+        else:
+            sentences.append(fragment)
+    return sentences
+
+def rank_sentences(sentences):
+    """Score sentences with TextRank over a TF-IDF cosine-similarity graph"""
+    n = len(sentences)
+    if n < 2:
+        return np.ones(n)
+
+    # Map every non-stopword token to a vocabulary id, remembering its sentence
+    vocabulary = {}
+    sentence_ids = []
+    token_ids = []
+    for index, sentence in enumerate(sentences):
+        for token in TOKEN_PATTERN.findall(sentence.lower()):
+            if token in STOPWORDS or len(token) < 2:
+                continue
+            sentence_ids.append(index)
+            token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+
+    if not vocabulary:
+        return np.ones(n)
+
+    # Term-frequency matrix (sentences x vocabulary) built in one bincount; the
+    # input caps in compress_text keep it to a few MB
+    vocab_size = len(vocabulary)
+    flat_ids = np.asarray(sentence_ids) * vocab_size + np.asarray(token_ids)
+    tf = np.bincount(flat_ids, minlength=n * vocab_size).reshape(n, vocab_size).astype(np.float64)
+
+    # Sublinear TF with smoothed IDF, then L2-normalize rows
+    document_frequency = np.count_nonzero(tf, axis=0)
+    idf = np.log((1 + n) / (1 + document_frequency)) + 1
+    tfidf = np.log1p(tf) * idf
+    norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+    tfidf /= np.where(norms == 0, 1, norms)
+
+    # Cosine similarity graph without self-loops, row-normalized into a transition matrix
+    similarity = tfidf @ tfidf.T
+    np.fill_diagonal(similarity, 0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    transition = np.divide(similarity, out_weight, out=np.full_like(similarity, 1.0 / n), where=out_weight > 0)
+
+    # Power iteration for the PageRank stationary distribution
+    scores = np.full(n, 1.0 / n)
+    teleport = (1 - TEXTRANK_DAMPING) / n
+    for _ in range(TEXTRANK_MAX_ITERATIONS):
+        updated = teleport + TEXTRANK_DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TEXTRANK_TOLERANCE:
+            scores = updated
+            break
+        scores = updated
+
+    return scores
+
+def compress_text(text, budget):
+    """Pack the highest-ranked sentences, in original order, into a character budget
+
+    Only the first MAX_INPUT_CHARS characters and MAX_SENTENCES sentences are
+    considered. Falls back to plain truncation when the text already fits, when
+    it cannot be split into sentences, or when no single sentence fits the budget.
+    """
+    if len(text) <= budget:
+        return text
+
+    sentences = split_sentences(text[:MAX_INPUT_CHARS])
+    if len(text) > MAX_INPUT_CHARS:
+        sentences = sentences[:-1]  # The cap most likely cut the last sentence short
+    sentences = sentences[:MAX_SENTENCES]
+    if len(sentences) < 2:
+        return text[:budget]
+
+    scores = rank_sentences(sentences)
+    lengths = np.fromiter((len(s) for s in sentences), dtype=np.int64, count=len(sentences))
+
+    # Greedily take sentences by descending score while they fit (joined by single spaces)
+    selected = []
+    used = -1
+    for index in np.argsort(-scores, kind='stable'):
+        cost = lengths[index] + 1
+        if used + cost <= budget:
+            selected.append(index)
+            used += cost
+
+    if not selected:
+        return text[:budget]
+
+    return ' '.join(sentences[i] for i in sorted(selected))
@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+import app
+
+ARTICLE = "The city council approved the new light-rail project on Tuesday. " * 5
+
+@pytest.fixture(autouse=True)
+def clear_analysis_cache():
+    app._analysis_cache.clear()
+    app._analysis_in_flight.clear()
+    yield
+    app._analysis_cache.clear()
+    app._analysis_in_flight.clear()
+
+def test_generate_summary_caches_each_tone(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app, '_request_summary', lambda text, tone, is_url: calls.append(tone) or f"{tone} summary")
+
+    assert app.generate_summary(ARTICLE, 'neutral') == "neutral summary"
+    assert app.generate_summary(ARTICLE, 'neutral') == "neutral summary"
+    assert app.generate_summary(ARTICLE, 'positive') == "positive summary"
+    assert calls == ['neutral', 'positive']
+
+def test_concurrent_callers_share_one_compute_call(monkeypatch):
+    calls = []
+    release = threading.Event()
+
+    def request_summary(text, tone, is_url):
+        calls.append(tone)
+        release.wait(5)
+        return "shared summary"
+
+    monkeypatch.setattr(app, '_request_summary', request_summary)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(app.generate_summary(ARTICLE, 'neutral')))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)  # Let every caller reach the cache before the first one finishes
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert calls == ['neutral']
+    assert results == ["shared summary"] * 5
+
+def test_uncacheable_bias_fallback_is_not_stored(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app, '_request_bias_analysis',
+                        lambda text, is_url: calls.append(text) or ({'bias_score': 5.0}, False))
+
+    app.analyze_bias(ARTICLE)
+    app.analyze_bias(ARTICLE)
+    assert len(calls) == 2
+    assert not app._analysis_cache
+
+def test_cacheable_bias_analysis_is_reused(monkeypatch):
+    calls = []
+    monkeypatch.setattr(app, '_request_bias_analysis',
+                        lambda text, is_url: calls.append(text) or ({'bias_score': 2.0}, True))
+
+    assert app.analyze_bias(ARTICLE) == {'bias_score': 2.0}
+    assert app.analyze_bias(ARTICLE) == {'bias_score': 2.0}
+    assert len(calls) == 1
+
+@pytest.mark.parametrize('error', [Exception("API down"), KeyboardInterrupt()])
+def test_in_flight_entry_is_removed_after_exception(error):
+    key = app._analysis_cache_key('summary', ARTICLE, False, 'neutral')
+
+    def compute():
+        raise error
+
+    with pytest.raises(type(error)):
+        app.get_or_compute(key, compute)
+    assert key not in app._analysis_in_flight
+    assert app.get_or_compute(key, lambda: ("recovered", True)) == "recovered"
+
+def test_tone_summaries_report_partial_failures_separately(monkeypatch):
+    delays = {'neutral': 0.1, 'positive': 0, 'negative': 0}
+
+    def request_summary(text, tone, is_url):
+        time.sleep(delays[tone])
+        if tone == 'positive':
+            raise Exception("rate limited")
+        return f"{tone} summary"
+
+    monkeypatch.setattr(app, '_request_summary', request_summary)
+
+    summaries, errors = app.generate_tone_summaries(ARTICLE, ['neutral', 'positive', 'negative'])
+    assert list(summaries.items()) == [('neutral', "neutral summary"), ('negative', "negative summary")]
+    assert errors == {'positive': "rate limited"}
+
+def test_tone_summaries_raise_when_every_tone_fails(monkeypatch):
+    def request_summary(text, tone, is_url):
+        raise Exception(f"{tone} failed")
+
+    monkeypatch.setattr(app, '_request_summary', request_summary)
+
+    with pytest.raises(Exception, match="failed"):
+        app.generate_tone_summaries(ARTICLE, ['neutral', 'analytical'])
@@ -0,0 +1,81 @@
+from extractive import MAX_INPUT_CHARS, compress_text, rank_sentences, split_sentences
+
+ARTICLE = (
+    "By Staff Reporter. Published Monday. "
+    "The city council approved the new light-rail project on Tuesday. "
+    "Dr. Smith, who chairs the transport committee, said the light-rail project would cut commute times. "
+    "Opponents said the light-rail budget was too high. "
+    "The weather was mild. "
+    "Council members will review the light-rail budget again in March. "
+    "A local bakery won a regional award for its sourdough. "
+    "Engineers estimate the light-rail line will carry 40,000 riders a day. "
+    "The transport committee will publish the light-rail construction schedule next week. "
+    "Tickets for the summer music festival go on sale Friday. "
+    "Residents near the planned light-rail depot asked the council for noise barriers. "
+    "Funding for the light-rail project comes from a regional transport levy."
+)
+
+def test_split_sentences_keeps_abbreviations_together():
+    assert split_sentences("Dr. Smith met Mr. Jones in the U.S. Senate. They talked.") == [
+        "Dr. Smith met Mr. Jones in the U.S. Senate.",
+        "They talked.",
+    ]
+
+def test_split_sentences_keeps_closing_quotes_and_parentheses():
+    assert split_sentences('He said "stop now." Then he left (quickly.) After that, “nothing.” The end.') == [
+        'He said "stop now."',
+        "Then he left (quickly.)",
+        "After that, “nothing.”",
+        "The end.",
+    ]
+
+def test_split_sentences_normalizes_whitespace():
+    assert split_sentences("  One sentence.\n\n  Another   one!  ") == ["One sentence.", "Another one!"]
+
+def test_article_fixture_has_distinct_sentences():
+    sentences = split_sentences(ARTICLE)
+    assert len(sentences) == 13
+    assert len(set(sentences)) == len(sentences)
+
+def test_rank_sentences_prefers_central_sentences():
+    sentences = split_sentences(ARTICLE)
+    scores = rank_sentences(sentences)
+    assert len(scores) == len(sentences)
+    off_topic = ["The weather was mild.", "Tickets for the summer music festival go on sale Friday."]
+    on_topic = "Council members will review the light-rail budget again in March."
+    for sentence in off_topic:
+        assert scores[sentences.index(sentence)] < scores[sentences.index(on_topic)]
+
+def test_compress_text_respects_budget():
+    for budget in (50, 200, 500, 1000):
+        assert len(compress_text(ARTICLE, budget)) <= budget
+
+def test_compress_text_keeps_original_order():
+    sentences = split_sentences(ARTICLE)
+    selected = split_sentences(compress_text(ARTICLE, 400))
+    positions = [sentences.index(sentence) for sentence in selected]
+    assert len(selected) > 2
+    assert all(earlier < later for earlier, later in zip(positions, positions[1:]))
+
+def test_compress_text_selects_top_ranked_sentences():
+    sentences = split_sentences(ARTICLE)
+    scores = rank_sentences(sentences)
+    selected = split_sentences(compress_text(ARTICLE, 400))
+    best = max(range(len(sentences)), key=lambda i: scores[i])
+    assert sentences[best] in selected
+    assert "The weather was mild." not in selected
+
+def test_compress_text_returns_short_text_unchanged():
+    assert compress_text("Short text. Fits easily.", 100) == "Short text. Fits easily."
+
+def test_compress_text_truncates_unsplittable_text():
+    assert compress_text("x" * 5000, 100) == "x" * 100
+
+def test_compress_text_truncates_when_no_sentence_fits():
+    text = "A very long first sentence about the budget. Another long sentence about the budget."
+    assert compress_text(text, 20) == text[:20]
+
+def test_compress_text_ignores_text_beyond_input_cap():
+    tail = "Zebra sentence that appears only after the cap."
+    text = " ".join([ARTICLE] * (MAX_INPUT_CHARS // len(ARTICLE) + 1)) + " " + tail * 50
+    assert "Zebra" not in compress_text(text, 2000)